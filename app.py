@@ -1,17 +1,28 @@
-from statistics import mean
-from typing import Counter
-from flask import Flask, request, jsonify
+import numpy as np
+import orjson
+from flask import Flask, request
 from flask_cors import CORS
 from clustering import cluster_comments
-from youtube_api import extract_video_id, fetch_and_preprocess_comments, analyze_sentiment
+from youtube_api import (
+    extract_video_id,
+    fetch_and_preprocess_comments,
+    get_sentiment_for_video,
+)
 from dotenv import load_dotenv
-from youtube_api import extract_video_id, analyze_sentiment
 
 load_dotenv() 
 
 app = Flask(__name__)
 CORS(app)
 
+# Serialize JSON responses with orjson, which also encodes NumPy types natively
+def jsonify_fast(obj, status=200):
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
 @app.route("/")
 def home():
     return "Hello, Flask!"
@@ -44,16 +55,16 @@ def fetch_comments():
         video_url = data.get('video_url')
 
         if not video_url:
-            return jsonify({'error': 'video_url is required'}), 400
+            return jsonify_fast({'error': 'video_url is required'}, 400)
 
         video_id = extract_video_id(video_url)
         if not video_id:
-            return jsonify({'error': 'Invalid YouTube URL'}), 400
+            return jsonify_fast({'error': 'Invalid YouTube URL'}, 400)
 
         # Fetch and preprocess comments
         comments = fetch_and_preprocess_comments(video_id)
 
-        return jsonify({
+        return jsonify_fast({
             "video_id": video_id,
             "video_url": video_url,
             "comment_count": len(comments),
@@ -64,7 +75,7 @@ def fetch_comments():
         }
         })
     except Exception as e:
-        return jsonify({"error": f"Failed to retrieve comments: {str(e)}"}), 500
+        return jsonify_fast({"error": f"Failed to retrieve comments: {str(e)}"}, 500)
 
 # Flask endpoint to perform sentiment analysis on preprocessed comments
 @app.route('/api/sentiment-analysis', methods=['POST'])
@@ -90,39 +101,33 @@ def sentiment_analysis():
         video_url = data.get('video_url')
         
         if not video_url:
-            return jsonify({'error': 'video_url is required'}), 400
+            return jsonify_fast({'error': 'video_url is required'}, 400)
         
         video_id = extract_video_id(video_url)
         if not video_id:
-            return jsonify({'error': 'Invalid YouTube URL'}), 400
+            return jsonify_fast({'error': 'Invalid YouTube URL'}, 400)
 
-        comments = fetch_and_preprocess_comments(video_id)
+        # Fetch, preprocess and analyze sentiment (shared with the cluster endpoint)
+        comments = get_sentiment_for_video(video_id)
         if not comments:
-            return jsonify({'error': 'No comments found for this video'}), 404
-        
-        # Analyze sentiment for each comment
-        analyzed_comments = []
-        sentiment_counts = Counter()
-        confidence_counts = Counter()
-        compound_scores = []
-
-        for comment in comments:
-            cleaned_text = comment.get('cleaned_text') or fetch_and_preprocess_comments(comment.get('text', ''))
-            if not cleaned_text:
-                continue
-
-            # Proper sentiment analysis function
-            sentiment_result = analyze_sentiment(cleaned_text)
-
-            analyzed_comment = {**comment, 'sentiment': sentiment_result}
-            analyzed_comments.append(analyzed_comment)
-
-            # Update statistics
-            sentiment_counts[sentiment_result['sentiment']] += 1
-            confidence_counts[sentiment_result['confidence']] += 1
-            compound_scores.append(sentiment_result['compound'])
+            return jsonify_fast({'error': 'No comments found for this video'}, 404)
         
+        # Only comments with text left after cleaning are analyzed
+        analyzed_comments = [comment for comment in comments if comment['cleaned_text']]
+        if not analyzed_comments:
+            return jsonify_fast({'error': 'No comments found for this video'}, 404)
+
+        results = [comment['sentiment'] for comment in analyzed_comments]
         total = len(analyzed_comments)
+
+        # Count sentiments and confidence levels (every key is present, even at zero)
+        sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        labels, label_counts = np.unique([r['sentiment'] for r in results], return_counts=True)
+        sentiment_counts.update(zip(labels.tolist(), label_counts.tolist()))
+
+        confidence_counts = {'high': 0, 'medium': 0, 'low': 0}
+        levels, level_counts = np.unique([r['confidence'] for r in results], return_counts=True)
+        confidence_counts.update(zip(levels.tolist(), level_counts.tolist()))
         
         # Calculate percentages
         sentiment_distribution = {
@@ -130,7 +135,10 @@ def sentiment_analysis():
         }
         
         # Calculate average compound score
-        avg_compound = round(mean(compound_scores), 3)
+        # Uses the rounded compound scores returned with each comment, as the
+        # original per-comment loop did, rather than the unrounded VADER output
+        compound_scores = np.fromiter((r['compound'] for r in results), dtype=np.float32, count=total)
+        avg_compound = round(float(compound_scores.mean()), 3)
         if avg_compound >= 0.05:
             overall_sentiment = 'positive'
         elif avg_compound <= -0.05:
@@ -138,20 +146,20 @@ def sentiment_analysis():
         else:
             overall_sentiment = 'neutral'
         
-        return jsonify({
+        return jsonify_fast({
             'success': True,
             'comments': analyzed_comments,
             'statistics': {
                 'total_comments': total,
-                'sentiment_counts': dict(sentiment_counts),
+                'sentiment_counts': sentiment_counts,
                 'sentiment_distribution': sentiment_distribution,
-                'confidence_counts': dict(confidence_counts),
+                'confidence_counts': confidence_counts,
                 'average_compound_score': avg_compound,
                 'overall_sentiment': overall_sentiment,
             },
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jsonify_fast({'error': str(e)}, 500)
 
 # Flask endpoint to cluster comments based on sentiment
 @app.route('/api/cluster-comments', methods=['POST'])
@@ -170,7 +178,7 @@ def cluster_comments_endpoint():
             "success": true,
             "video": {...video info...},
             "comments": [...comments with clusters...],
-            "clusters": {...cluster analysis...},
+            "clusters": {...cluster analysis, members as indices into "comments"...},
             "sentiment_statistics": {...},
             "cluster_statistics": {...}
         }
@@ -181,41 +189,18 @@ def cluster_comments_endpoint():
         num_clusters = data.get('num_clusters', 5)
         
         if not video_url:
-            return jsonify({'error': 'video_url is required'}), 400
+            return jsonify_fast({'error': 'video_url is required'}, 400)
         
         # Extract video ID
         video_id = extract_video_id(video_url)
         if not video_id:
-            return jsonify({'error': 'Invalid YouTube URL'}), 400
+            return jsonify_fast({'error': 'Invalid YouTube URL'}, 400)
     
-        # Fetch and preprocess comments
-        comments = fetch_and_preprocess_comments(video_id)
+        # Fetch, preprocess and analyze sentiment (shared with the sentiment endpoint)
+        comments = get_sentiment_for_video(video_id)
         
         if not comments:
-            return jsonify({'error': 'No comments found for this video'}), 404
-
-        # Analyze sentiment for each comment and populate statistics
-        # The following variables are declared here to be populated in this step.
-        # Note: The declarations below this block in the original file will become redundant.
-        analyzed_comments = [] 
-        sentiment_counts = Counter()
-        confidence_counts = Counter()
-        compound_scores = []
-        
-        for comment in comments:
-            cleaned_text = comment.get('cleaned_text', '')
-            sentiment_result = analyze_sentiment(cleaned_text)
-            
-            # Add sentiment to the comment dictionary (modifies 'comments' list in place)
-            comment['sentiment'] = sentiment_result
-            
-            # Populate the sentiment statistics
-            sentiment_counts[sentiment_result['sentiment']] += 1
-            confidence_counts[sentiment_result['confidence']] += 1
-            compound_scores.append(sentiment_result['compound'])
-            
-            # Add the sentiment-augmented comment to the analyzed_comments list
-            analyzed_comments.append(comment)
+            return jsonify_fast({'error': 'No comments found for this video'}, 404)
         
         # Cluster comments
         clustered_comments, clusters_info, statistics = cluster_comments(
@@ -224,7 +209,7 @@ def cluster_comments_endpoint():
         )
         
         # Return complete results
-        return jsonify({
+        return jsonify_fast({
             'success': True,
             'video': video_id,
             'num_clusters': num_clusters,
@@ -233,7 +218,7 @@ def cluster_comments_endpoint():
             'statistics': statistics
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jsonify_fast({'error': str(e)}, 500)
 
 if __name__ == "__main__":
     app.run(debug=True, port=5000)
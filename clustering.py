@@ -3,13 +3,20 @@ Clustering Functions
 Handles K-Means clustering of comments based on sentiment
 """
 
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import numpy as np
 
+# Mini-batch size used once there are enough comments to benefit from it
+MINI_BATCH_SIZE = 1024
+
+# Sentiment types in the order they are counted (ties go to the earliest)
+SENTIMENT_TYPES = ['positive', 'negative', 'neutral']
+SENTIMENT_INDEX = {sentiment: i for i, sentiment in enumerate(SENTIMENT_TYPES)}
+
 def cluster_comments(comments, num_clusters=5):
     """
     Cluster comments based on sentiment scores using K-Means
+    Each comment dictionary is tagged in place with 'cluster' and 'cluster_label'
     
     Args:
         comments (list): List of comments with sentiment data
@@ -38,94 +45,72 @@ def cluster_comments(comments, num_clusters=5):
         raise ValueError(f'Need at least {num_clusters} comments for {num_clusters} clusters')
     
     # Extract features for clustering
-    features = []
-    for comment in valid_comments:
+    # VADER scores are already bounded (compound in [-1, 1], the rest in [0, 1]),
+    # so they are clustered as-is without standardization
+    X = np.empty((len(valid_comments), 4), dtype=np.float32)
+    for i, comment in enumerate(valid_comments):
         sentiment = comment['sentiment']
-        features.append([
+        X[i] = (
             sentiment['compound'],
             sentiment['positive'],
             sentiment['neutral'],
             sentiment['negative']
-        ])
+        )
     
-    X = np.array(features)
+    # Apply K-Means clustering
+    # A single k-means++ initialization is enough in this 4-dimensional space,
+    # and mini-batch updates take over for larger comment sets
+    if len(X) < 2 * MINI_BATCH_SIZE:
+        kmeans = KMeans(n_clusters=num_clusters, random_state=42, n_init=1)
+    else:
+        kmeans = MiniBatchKMeans(
+            n_clusters=num_clusters,
+            random_state=42,
+            n_init=1,
+            batch_size=MINI_BATCH_SIZE
+        )
+    cluster_labels = kmeans.fit_predict(X)
     
-    # Standardize features
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    # Aggregate every cluster at once, grouping by cluster label
+    cluster_sizes = np.bincount(cluster_labels, minlength=num_clusters)
+    compound_sums = np.bincount(cluster_labels, weights=X[:, 0], minlength=num_clusters)
+    avg_compounds = compound_sums / np.maximum(cluster_sizes, 1)
     
-    # Apply K-Means clustering
-    kmeans = KMeans(n_clusters=num_clusters, random_state=42, n_init=10)
-    cluster_labels = kmeans.fit_predict(X_scaled)
+    # Count sentiment types per cluster
+    sentiment_ids = np.array([SENTIMENT_INDEX[c['sentiment']['sentiment']] for c in valid_comments])
+    sentiment_matrix = np.zeros((num_clusters, len(SENTIMENT_TYPES)), dtype=int)
+    np.add.at(sentiment_matrix, (cluster_labels, sentiment_ids), 1)
+    dominant_ids = sentiment_matrix.argmax(axis=1)
     
-    # Assign cluster labels to comments
-    clustered_comments = []
-    cluster_data = {}
+    # Determine cluster label based on average compound score
+    cluster_label_names = np.select(
+        [avg_compounds >= 0.3, avg_compounds >= 0.05, avg_compounds >= -0.05, avg_compounds >= -0.3],
+        ['highly_positive', 'positive', 'neutral', 'negative'],
+        default='highly_negative'
+    ).tolist()
     
-    for i, comment in enumerate(valid_comments):
-        cluster_id = int(cluster_labels[i])
-        
-        # Initialize cluster data if not exists
-        if cluster_id not in cluster_data:
-            cluster_data[cluster_id] = {
-                'comments': [],
-                'compound_scores': [],
-                'sentiments': []
-            }
-        
-        # Add comment to cluster
-        comment_with_cluster = {
-            **comment,
-            'cluster': cluster_id
-        }
-        
-        clustered_comments.append(comment_with_cluster)
-        cluster_data[cluster_id]['comments'].append(comment_with_cluster)
-        cluster_data[cluster_id]['compound_scores'].append(comment['sentiment']['compound'])
-        cluster_data[cluster_id]['sentiments'].append(comment['sentiment']['sentiment'])
+    # Assign cluster ids and labels to comments in a single pass, recording
+    # each cluster's members as indices into the returned comments list
+    cluster_members = {}
+    
+    for i, (comment, cluster_id) in enumerate(zip(valid_comments, cluster_labels.tolist())):
+        comment['cluster'] = cluster_id
+        comment['cluster_label'] = cluster_label_names[cluster_id]
+        cluster_members.setdefault(cluster_id, []).append(i)
     
     # Analyze each cluster
     clusters_info = {}
     
-    for cluster_id, data in cluster_data.items():
-        avg_compound = np.mean(data['compound_scores'])
-        
-        # Determine cluster label based on average compound score
-        if avg_compound >= 0.3:
-            label = 'highly_positive'
-        elif avg_compound >= 0.05:
-            label = 'positive'
-        elif avg_compound >= -0.05:
-            label = 'neutral'
-        elif avg_compound >= -0.3:
-            label = 'negative'
-        else:
-            label = 'highly_negative'
-        
-        # Count sentiment types in cluster
-        sentiment_counts = {
-            'positive': data['sentiments'].count('positive'),
-            'negative': data['sentiments'].count('negative'),
-            'neutral': data['sentiments'].count('neutral')
-        }
-        
-        # Get dominant sentiment
-        dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
-        
+    for cluster_id, members in cluster_members.items():
         clusters_info[str(cluster_id)] = {
-            'label': label,
-            'dominant_sentiment': dominant_sentiment,
-            'count': len(data['comments']),
-            'percentage': round((len(data['comments']) / len(valid_comments) * 100), 2),
-            'average_compound': round(avg_compound, 3),
-            'sentiment_counts': sentiment_counts,
-            'comments': data['comments']
+            'label': cluster_label_names[cluster_id],
+            'dominant_sentiment': SENTIMENT_TYPES[dominant_ids[cluster_id]],
+            'count': int(cluster_sizes[cluster_id]),
+            'percentage': round(float(cluster_sizes[cluster_id] / len(valid_comments) * 100), 2),
+            'average_compound': round(float(avg_compounds[cluster_id]), 3),
+            'sentiment_counts': dict(zip(SENTIMENT_TYPES, sentiment_matrix[cluster_id].tolist())),
+            'comment_indices': members
         }
-        
-        # Update comments with cluster label
-        for comment in clustered_comments:
-            if comment['cluster'] == cluster_id:
-                comment['cluster_label'] = label
     
     # Create statistics
     statistics = {
@@ -135,4 +120,4 @@ def cluster_comments(comments, num_clusters=5):
         'features_used': ['compound', 'positive', 'neutral', 'negative']
     }
     
-    return clustered_comments, clusters_info, statistics
\ No newline at end of file
+    return valid_comments, clusters_info, statistics
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Regression check for FastSentimentIntensityAnalyzer
+Its ASCII fast path must score exactly like the stock VADER analyzer
+Run with: python -m unittest test_sentiment
+"""
+
+import random
+import unittest
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from youtube_api import VADER_FAST_PATH, VADER_FAST_PATH_VERSION, vader_analyzer
+
+# Texts that exercise boosters, negations, 'but', 'kind of', caps and punctuation
+EDGE_CASES = [
+    "",
+    "   ",
+    "first",
+    "who is here in 2024",
+    "i love this so much",
+    "this is bad but ok",
+    "this is kind of good",
+    "not good at all",
+    "never ever bad",
+    "at least it was not the worst",
+    "without a doubt the best",
+    "GREAT video!!!",
+    "GREAT video, i LOVE it!!!?",
+    "good!! bad?? meh...",
+    "extremely good but very sad",
+    "no. just no",
+    ":) :( :D <3",
+    "lol lmao haha",
+    "isn't it great",
+    "so so good",
+]
+
+class FastPathMatchesStockAnalyzer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stock_analyzer = SentimentIntensityAnalyzer()
+
+    def assert_same_scores(self, texts):
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    vader_analyzer.polarity_scores(text),
+                    self.stock_analyzer.polarity_scores(text)
+                )
+
+    @unittest.skipUnless(VADER_FAST_PATH, f"fast path only runs on vaderSentiment {VADER_FAST_PATH_VERSION}")
+    def test_edge_cases(self):
+        self.assert_same_scores(EDGE_CASES)
+
+    @unittest.skipUnless(VADER_FAST_PATH, f"fast path only runs on vaderSentiment {VADER_FAST_PATH_VERSION}")
+    def test_random_texts(self):
+        # Random mixes of lexicon words, modifiers and non-lexicon words
+        rng = random.Random(42)
+        lexicon_words = sorted(self.stock_analyzer.lexicon)
+        words = rng.sample(lexicon_words, 500) + [
+            "very", "kind", "of", "but", "not", "never", "no", "least", "without",
+            "doubt", "lol", "xyz", "123", "video", "BIG", "LOVE", "a", "I",
+        ]
+        texts = [
+            " ".join(
+                rng.choice(words) + rng.choice(["", "", "!", "!!!", ".", ",", "?", "..."])
+                for _ in range(rng.randint(1, 10))
+            )
+            for _ in range(5000)
+        ]
+        self.assert_same_scores(texts)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,82 +1,383 @@
 import googleapiclient.discovery 
 import googleapiclient.errors
+import googleapiclient.http
+import googleapiclient.model
+import importlib.metadata
+import multiprocessing
 import os
+import queue
 import re
-import emoji
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import string
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from cachetools import LRUCache, TTLCache
+import numpy as np
+import orjson
+from vaderSentiment.vaderSentiment import BOOSTER_DICT, SentiText, SentimentIntensityAnalyzer, allcap_differential
 
 API_KEY = os.getenv("YOUTUBE_API_KEY")
 
+# The ASCII fast path copies vaderSentiment internals from this release only;
+# any other installed version scores everything with the stock analyzer
+VADER_FAST_PATH_VERSION = "3.3.2"
+try:
+    VADER_FAST_PATH = importlib.metadata.version("vaderSentiment") == VADER_FAST_PATH_VERSION
+except importlib.metadata.PackageNotFoundError:
+    VADER_FAST_PATH = False
+
+# VADER analyzer with a fast path for ASCII text
+class FastSentimentIntensityAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER's polarity_scores first rebuilds the text one character at a time to
+    replace emojis with their descriptions. Every emoji it knows is non-ASCII,
+    so ASCII text skips that loop and goes straight to scoring.
+    test_sentiment.py checks the fast path against the stock analyzer.
+    """
+
+    def polarity_scores(self, text):
+        if not VADER_FAST_PATH or not text.isascii():
+            return super().polarity_scores(text)
+
+        # Same steps as SentimentIntensityAnalyzer.polarity_scores (vaderSentiment 3.3.2)
+        text = text.strip()
+
+        words_and_emoticons = list(map(SentiText._strip_punc_if_word, text.split()))
+
+        # Only lexicon words get a valence, so without one every word scores zero
+        if self.lexicon.keys().isdisjoint(map(str.lower, words_and_emoticons)):
+            return self.score_valence([0] * len(words_and_emoticons), text)
+
+        # Same fields as SentiText(text), reusing the words split above
+        sentitext = SentiText.__new__(SentiText)
+        sentitext.text = text
+        sentitext.words_and_emoticons = words_and_emoticons
+        sentitext.is_cap_diff = allcap_differential(words_and_emoticons)
+
+        sentiments = []
+        for i, item in enumerate(words_and_emoticons):
+            valence = 0
+            # check for vader_lexicon words that may be used as modifiers or negations
+            if item.lower() in BOOSTER_DICT:
+                sentiments.append(valence)
+                continue
+            if (i < len(words_and_emoticons) - 1 and item.lower() == "kind" and
+                    words_and_emoticons[i + 1].lower() == "of"):
+                sentiments.append(valence)
+                continue
+
+            sentiments = self.sentiment_valence(valence, sentitext, item, i, sentiments)
+
+        sentiments = self._but_check(words_and_emoticons, sentiments)
+
+        return self.score_valence(sentiments, text)
+
 # Initialize VADER sentiment analyzer
-vader_analyzer = SentimentIntensityAnalyzer()
+vader_analyzer = FastSentimentIntensityAnalyzer()
+
+# Worker processes for VADER scoring, which is pure Python and holds the GIL
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+_youtube_client = None
+_youtube_client_lock = threading.Lock()
+
+# Partial response mask: only the comment fields read by get_youtube_comments
+COMMENT_THREAD_FIELDS = (
+    "nextPageToken,"
+    "items(snippet/topLevelComment(id,snippet(authorDisplayName,textDisplay,likeCount,publishedAt)))"
+)
+
+# Idle http objects, kept so their open connections are reused by later fetches
+_idle_http = queue.SimpleQueue()
+
+# Preprocessed and scored comments, shared by every endpoint working on the same video
+VIDEO_CACHE_TTL = 300
+_video_cache = TTLCache(maxsize=128, ttl=VIDEO_CACHE_TTL)
+_video_cache_lock = threading.Lock()
+
+# VADER scores keyed by cleaned text, shared across videos and requests
+_sentiment_cache = LRUCache(maxsize=100_000)
+_sentiment_cache_lock = threading.Lock()
+
+# Emoji removed by preprocess_comments: keycap sequences, then runs of
+# pictographs, symbols, dingbats, flags, tags, joiners and variation selectors
+EMOJI_PATTERN = re.compile(
+    '[#*0-9]\ufe0f?\u20e3'
+    '|['
+    '\U0001F000-\U0001FAFF'
+    '\u2139\u2300-\u23FF'
+    '\u2600-\u27BF'
+    '\u2B00-\u2BFF'
+    '\U000E0020-\U000E007F'
+    '\u200d\ufe0e\ufe0f\u20e3'
+    ']+'
+)
+
+# URLs and HTML tags removed by preprocess_comments
+# Tags cannot contain '<', so an unclosed '<' fails at the next one instead of
+# rescanning the rest of the line, keeping the pass linear on any input
+MARKUP_PATTERN = re.compile(r'http\S+|www\.\S+|<[^<>\n]*>')
+
+# Symbols outside basic punctuation removed by preprocess_comments
+# '@' falls in this class, which turns "@nikhil" into "nikhil".
+SYMBOL_PATTERN = re.compile(r'[^\w\s.,!?\-\'\"]')
+
+# Emoji and symbols are removed from non-ASCII text in a single pass
+NON_ASCII_STRIP_PATTERN = re.compile(EMOJI_PATTERN.pattern + '|' + SYMBOL_PATTERN.pattern)
+
+# Translation table for ASCII text: deletes the same symbols as SYMBOL_PATTERN
+# and lowercases A-Z, so both steps run as a single str.translate call
+ASCII_CLEAN_TABLE = {i: None for i in range(128) if SYMBOL_PATTERN.match(chr(i))}
+ASCII_CLEAN_TABLE.update({ord(c): ord(c.lower()) for c in string.ascii_uppercase})
+
+# Video ID from a watch, short link, embed or shorts URL
+VIDEO_ID_PATTERN = re.compile(
+    r'(?:youtube\.com/(?:watch\?v=|embed/|shorts/)|youtu\.be/)(?P<id>[^&\n?#]+)'
+)
+
+# Characters allowed in a bare 11-character video ID
+VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
 
 # Extract video ID from YouTube URL
 def extract_video_id(url):
     """Extract video ID from YouTube URL"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-        r'youtube\.com\/shorts\/([^&\n?#]+)'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    if len(url) == 11 and re.match(r'^[A-Za-z0-9_-]{11}$', url):
+    if len(url) == 11 and VIDEO_ID_CHARS.issuperset(url):
         return url
-    return None
+    match = VIDEO_ID_PATTERN.search(url)
+    if not match:
+        return None
+    return match.group('id')
+
+# Response model that parses API responses with orjson
+class OrjsonModel(googleapiclient.model.JsonModel):
+    """
+    JsonModel with the same response handling, but decoding bodies with
+    orjson. Bodies orjson rejects go through the stock json path instead.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+# Build the YouTube Data API client once
+def get_youtube_client():
+    """
+    Return the shared YouTube Data API client
+    The discovery document is parsed on first use only. httplib2 connections
+    are not thread-safe, so callers pass their own http object to execute(),
+    checked out with acquire_http() and handed back with release_http().
+    """
+    global _youtube_client
+    with _youtube_client_lock:
+        if _youtube_client is None:
+            _youtube_client = googleapiclient.discovery.build(
+                "youtube",
+                "v3",
+                developerKey=API_KEY,
+                cache_discovery=False,
+                static_discovery=True,
+                model=OrjsonModel()
+            )
+    return _youtube_client
+
+# Check out an http object for one caller at a time
+def acquire_http():
+    """Return an idle http object, or a new one if none is available"""
+    try:
+        return _idle_http.get_nowait()
+    except queue.Empty:
+        return googleapiclient.http.build_http()
+
+# Return an http object so its connections can be reused
+def release_http(http):
+    """Make an http object available to the next acquire_http() call"""
+    _idle_http.put(http)
 
 # Get YouTube comments
 def get_youtube_comments(video_id):
     """
     Fetches all top-level comments for a given YouTube video ID using the YouTube Data API.
-    Handles pagination to retrieve more than 100 comments.
 
     Args:
         video_id (str): The ID of the YouTube video.
-        api_key (str): Your YouTube Data API key.
 
     Returns:
         list: A list of dictionaries, each representing a comment.
               Returns an empty list if no comments are found or an error occurs.
     """
-    youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=API_KEY)
+    return _fetch_youtube_comments(video_id)[0]
+
+# Fetch every page of comments, reporting whether pagination reached the end
+def _fetch_youtube_comments(video_id):
+    """
+    Fetches all top-level comments for a given YouTube video ID using the YouTube Data API.
+    Handles pagination to retrieve more than 100 comments. Each page is requested as
+    soon as its token is known, so it downloads while the previous page is processed:
+    its texts are cleaned, and the ones not scored before are sent to a worker process
+    for VADER. The scores are collected once every page has arrived.
+
+    Args:
+        video_id (str): The ID of the YouTube video.
+
+    Returns:
+        tuple: (comments, complete), where complete is False if an error
+               ended pagination and comments holds only the earlier pages
+    """
+    youtube = get_youtube_client()
+    http = acquire_http()
     comments_list = []
-    next_page_token = None
+    cleaned_texts = []
+    complete = True
+
+    # Scores found in the cache, the texts sent off for scoring, and for each page
+    # that sent any, its first index in comments_list
+    known_scores = {}
+    scheduled_texts = set()
+    pending_scores = []
+
+    def fetch_page(page_token):
+        request = youtube.commentThreads().list(
+            part="snippet",
+            videoId=video_id,
+            maxResults=100, 
+            pageToken=page_token,
+            textFormat="plainText",
+            fields=COMMENT_THREAD_FIELDS
+        )
+        return request.execute(http=http)
+
+    # Page requests run on a single background thread so the next page is
+    # already in flight while the current one is being processed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_page = executor.submit(fetch_page, None)
+
+        while pending_page is not None:
+            try:
+                response = pending_page.result()
+
+                next_page_token = response.get("nextPageToken")
+                pending_page = executor.submit(fetch_page, next_page_token) if next_page_token else None
+
+                page_comments = []
+                for item in response['items']:
+                    top_level_comment = item['snippet']['topLevelComment']
+                    comment_data = top_level_comment['snippet']
 
-    while True:
+                    page_comments.append({
+                        'id': top_level_comment['id'],
+                        'author': comment_data['authorDisplayName'],
+                        'text': comment_data['textDisplay'],
+                        'likes': comment_data['likeCount'],
+                        'published_at': comment_data['publishedAt'],
+                    })
+
+                page_cleaned_texts = preprocess_comments_batch([comment['text'] for comment in page_comments])
+
+                missing = [
+                    text for text in _uncached_texts(page_cleaned_texts, known_scores)
+                    if text not in scheduled_texts
+                ]
+                if missing:
+                    # The last page has no download left to overlap with, so it is scored here
+                    if pending_page is not None:
+                        pool, future = _submit_to_pool(_score_texts, missing)
+                    else:
+                        pool, future = None, _completed_future(_score_texts, missing)
+                    scheduled_texts.update(missing)
+                    pending_scores.append((len(comments_list), missing, pool, future))
+
+                # The page is kept only once every text has a score on the way, so an
+                # error above ends pagination with the comments of the earlier pages
+                comments_list.extend(page_comments)
+                cleaned_texts.extend(page_cleaned_texts)
+            except googleapiclient.errors.HttpError as e:
+                print(f"An API error occurred while fetching comments for video ID {video_id}: {e}")
+                complete = False
+                break
+            except Exception as e:
+                print(f"An unexpected error occurred: {e}")
+                complete = False
+                break
+
+    release_http(http)
+
+    for page_start, texts, pool, future in pending_scores:
         try:
-            request = youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=100, 
-                pageToken=next_page_token,
-                textFormat="plainText" 
-            )
-            response = request.execute()
-
-            for item in response['items']:
-                comment_data = item['snippet']['topLevelComment']['snippet']
-                cleaned_text = preprocess_comments(comment_data['textDisplay'])
-
-                comments_list.append({
-                'id': item['snippet']['topLevelComment']['id'],
-                'author': comment_data['authorDisplayName'],
-                'text': comment_data['textDisplay'],
-                'likes': comment_data['likeCount'],
-                'published_at': comment_data['publishedAt'],
-                'sentiment': analyze_sentiment(cleaned_text)
-        })
-
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
-                break 
-        except googleapiclient.errors.HttpError as e:
-            print(f"An API error occurred while fetching comments for video ID {video_id}: {e}")
-            break
+            _store_scores(texts, _pool_result(_score_texts, texts, pool, future), known_scores)
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            # Later pages can reuse this page's scores, so they are dropped with it
+            print(f"An unexpected error occurred while scoring comments: {e}")
+            del comments_list[page_start:], cleaned_texts[page_start:]
+            complete = False
             break
-    return comments_list
+
+    sentiments = build_sentiment_results(_scores_for(cleaned_texts, known_scores))
+    for comment, cleaned_text, sentiment in zip(comments_list, cleaned_texts, sentiments):
+        comment['cleaned_text'] = cleaned_text
+        comment['sentiment'] = sentiment
+
+    return comments_list, complete
+
+# Create the shared worker pool on first use
+def get_process_pool():
+    """
+    Return the process pool used for CPU-bound batch work
+    Where available, workers are forked from a server process that has already
+    imported this module, so the VADER lexicon is parsed once and its pages are
+    shared with every worker instead of being reloaded in each one.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            mp_context = None
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context('forkserver')
+                mp_context.set_forkserver_preload([__name__])
+            _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context)
+    return _process_pool
+
+# Drop a pool whose workers died so the next caller starts a fresh one
+def _reset_process_pool(pool):
+    """Discard pool if it is still the shared one"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+# Wrap an inline call in a Future, matching what the pool returns
+def _completed_future(func, items):
+    future = Future()
+    future.set_result(func(items))
+    return future
+
+# Start func(items) in a worker process, or run it here on single-core machines
+def _submit_to_pool(func, items):
+    """Return the pool used (None when run inline) and a Future for func(items)"""
+    if (os.cpu_count() or 1) >= 2:
+        pool = get_process_pool()
+        try:
+            return pool, pool.submit(func, items)
+        except BrokenProcessPool:
+            _reset_process_pool(pool)
+    return None, _completed_future(func, items)
+
+# Wait for a result from _submit_to_pool
+def _pool_result(func, items, pool, future):
+    """Return func(items), computed here instead if the worker failed or died"""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        _reset_process_pool(pool)
+    except Exception as e:
+        print(f"A worker failed, scoring its texts here instead: {e}")
+    return func(items)
 
 # Preprocess comments to remove emojis, extra symbols, and clean text for sentiment analysis
 def preprocess_comments(text):
@@ -92,58 +393,128 @@ def preprocess_comments(text):
     if not text:
         return ""
     
-    # Remove emojis
-    text = emoji.replace_emoji(text, replace='')
-    
-    # Remove URLs
-    text = re.sub(r'http\S+|www\.\S+', '', text)
-    
-    # Remove HTML tags
-    text = re.sub(r'<.*?>', '', text)
+    # Remove URLs and HTML tags (substring checks skip the regex for plain text)
+    if '<' in text or 'http' in text or 'www.' in text:
+        text = MARKUP_PATTERN.sub('', text)
     
-    # Remove extra punctuation and symbols (keep basic punctuation for sentiment)
+    # Remove emojis, extra punctuation and symbols (keep basic punctuation for sentiment)
     # Keep: . , ! ? - ' "
-    text = re.sub(r'[^\w\s.,!?\-\'\"]', '', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Convert to lowercase for consistency
+    # ASCII text cannot contain emojis, so a translation table covers it
+    if text.isascii():
+        text = text.translate(ASCII_CLEAN_TABLE)
+    else:
+        text = NON_ASCII_STRIP_PATTERN.sub('', text).lower()
     
-    # Remove leading/trailing whitespace
-    text = text.strip()
+    # Collapse whitespace and remove leading/trailing whitespace
+    text = ' '.join(text.split())
     
-    # Convert to lowercase for consistency
-    text = text.lower()
+    return text
 
-    # Filter usernames (e.g., @nikhil -> nikhil)
-    text = re.sub(r'@(\w+)', r'\1', text)
+# Preprocess many comments at once
+def preprocess_comments_batch(texts):
+    """
+    Preprocess a list of comment texts
+    Cleaning costs little next to VADER, so it runs in the current process
     
-    return text
+    Args:
+        texts (list): Raw comment texts
+        
+    Returns:
+        list: Cleaned comment texts, in the same order
+    """
+    return [preprocess_comments(text) for text in texts]
+
+# Fetch, preprocess and score a video's comments, cached per video
+def _get_processed_comments(video_id):
+    """
+    Return the cached comment dictionaries for a video, fetching them on a miss
+    Each one holds the cleaned author and text along with its sentiment
+    Results are cached per video for VIDEO_CACHE_TTL seconds, unless an error
+    cut pagination short, so the next request fetches the whole video again
+    """
+    with _video_cache_lock:
+        processed_comments = _video_cache.get(video_id)
+
+    if processed_comments is None:
+        comments, complete = _fetch_youtube_comments(video_id)
+
+        if not comments:
+            return []
+
+        # Comment texts were cleaned and scored while fetching; author names repeat
+        # across comments, so each distinct name is cleaned once
+        authors = list(dict.fromkeys(comment['author'] for comment in comments))
+        cleaned_authors = dict(zip(authors, preprocess_comments_batch(authors)))
+
+        processed_comments = [
+            {
+                'id': comment['id'],
+                'author': cleaned_authors[comment['author']],
+                'text': comment['text'],
+                'cleaned_text': comment['cleaned_text'],
+                'sentiment': comment['sentiment'],
+            }
+            for comment in comments
+        ]
+
+        if complete:
+            with _video_cache_lock:
+                _video_cache[video_id] = processed_comments
+
+    return processed_comments
 
 # Fetch and preprocess comments for sentiment analysis
 def fetch_and_preprocess_comments(video_id):
-    """Fetch comments and clean them immediately"""
-    comments = get_youtube_comments(video_id)
-
-    if not comments:
-        return []
-
-    processed_comments = []
-    for comment in comments:
-        cleaned_text = preprocess_comments(comment['text'])
-        processed_comments.append({
-            'id': comment.get('id'),
-            'author': preprocess_comments(comment.get('author')),
-            'text': comment.get('text'),
-            'cleaned_text': cleaned_text,
-        })
+    """
+    Fetch comments and keep the fields used for sentiment analysis
+    Returns copies from _get_processed_comments without the sentiment entries
+    """
+    return [
+        {key: value for key, value in comment.items() if key != 'sentiment'}
+        for comment in _get_processed_comments(video_id)
+    ]
 
-    return processed_comments
+# Build sentiment dictionaries for a batch of scores
+def build_sentiment_results(scores):
+    """
+    Classify a batch of VADER scores into sentiment labels and confidence levels
+    
+    Args:
+        scores (np.ndarray): Array of shape (n, 4) from analyze_sentiment_batch
+        
+    Returns:
+        list: Sentiment dictionaries, one per row of scores
+    """
+    compound = scores[:, 0]
+    sentiments = np.where(
+        compound >= 0.05, 'positive', np.where(compound <= -0.05, 'negative', 'neutral')
+    ).tolist()
+
+    confidence_scores = np.abs(compound)
+    confidences = np.select(
+        [confidence_scores >= 0.5, confidence_scores >= 0.2], ['high', 'medium'], default='low'
+    ).tolist()
+
+    return [
+        {
+            'compound': round(compound_score, 3),
+            'positive': round(positive, 3),
+            'neutral': round(neutral, 3),
+            'negative': round(negative, 3),
+            'sentiment': sentiment,
+            'confidence': confidence
+        }
+        for (compound_score, positive, neutral, negative), sentiment, confidence
+        in zip(scores.tolist(), sentiments, confidences)
+    ]
 
 # Analyze sentiment using VADER
 def analyze_sentiment(text):
     """
     Analyze sentiment using VADER
     VADER is specifically designed for social media text
+    Scores are cached by text, so duplicate comments are only scored once
     
     Args:
         text (str): Cleaned comment text
@@ -161,35 +532,8 @@ def analyze_sentiment(text):
             'confidence': 'low'
         }
     try:
-        scores = vader_analyzer.polarity_scores(text)
-        
-        compound = scores['compound']
-        
-        # Classify sentiment based on compound score
-        if compound >= 0.05:
-            sentiment = 'positive'
-        elif compound <= -0.05:
-            sentiment = 'negative'
-        else:
-            sentiment = 'neutral'
-        
-        confidence_score = abs(compound)
-        
-        if confidence_score >= 0.5:
-            confidence = 'high'
-        elif confidence_score >= 0.2:
-            confidence = 'medium'
-        else:
-            confidence = 'low'
-        
-        return {
-            'compound': round(compound, 3),
-            'positive': round(scores['pos'], 3),
-            'neutral': round(scores['neu'], 3),
-            'negative': round(scores['neg'], 3),
-            'sentiment': sentiment,
-            'confidence': confidence
-        }
+        # Goes through the batch path so repeated texts hit the score cache
+        return build_sentiment_results(analyze_sentiment_batch([text]))[0]
         
     except Exception as e:
         return {
@@ -200,4 +544,80 @@ def analyze_sentiment(text):
             'sentiment': 'neutral',
             'confidence': 'low',
             'error': str(e)
-        }
\ No newline at end of file
+        }
+
+# Score a list of texts with VADER in the current process
+def _score_texts(texts):
+    scores = np.empty((len(texts), 4), dtype=np.float64)
+    polarity_scores = vader_analyzer.polarity_scores
+
+    for i, text in enumerate(texts):
+        if not text:
+            scores[i] = (0.0, 0.0, 1.0, 0.0)
+            continue
+        result = polarity_scores(text)
+        scores[i] = (result['compound'], result['pos'], result['neu'], result['neg'])
+
+    return scores
+
+# Analyze sentiment for many comments in one pass
+def analyze_sentiment_batch(texts):
+    """
+    Analyze sentiment for a list of comments using VADER in a single pass
+    Scores are cached by text, so each distinct uncached text is scored once
+    
+    Args:
+        texts (list): Cleaned comment texts
+        
+    Returns:
+        np.ndarray: Array of shape (len(texts), 4) holding the
+                    compound, positive, neutral and negative scores
+    """
+    # Only score texts that are neither cached nor repeated within the batch
+    known = {}
+    missing = _uncached_texts(texts, known)
+
+    if missing:
+        _store_scores(missing, _score_texts(missing), known)
+
+    return _scores_for(texts, known)
+
+# Look up cached scores
+def _uncached_texts(texts, known):
+    """Add the cached scores of texts to known and return the distinct texts left to score"""
+    distinct = [text for text in dict.fromkeys(texts) if text not in known]
+    with _sentiment_cache_lock:
+        for text in distinct:
+            if text in _sentiment_cache:
+                known[text] = _sentiment_cache[text]
+    return [text for text in distinct if text not in known]
+
+# Record new scores in known and in the shared cache
+def _store_scores(texts, scores, known):
+    with _sentiment_cache_lock:
+        for text, row in zip(texts, scores.tolist()):
+            known[text] = _sentiment_cache[text] = tuple(row)
+
+# Gather the scores of texts from known into one array
+def _scores_for(texts, known):
+    scores = np.empty((len(texts), 4), dtype=np.float64)
+    for i, text in enumerate(texts):
+        scores[i] = known[text]
+    return scores
+
+
+# Fetch, preprocess and analyze sentiment for a video's comments
+def get_sentiment_for_video(video_id):
+    """
+    Fetch and preprocess comments and add VADER sentiment to each one
+    Returns copies from _get_processed_comments, so endpoints working on
+    the same video share a single pipeline run
+    
+    Args:
+        video_id (str): The ID of the YouTube video
+        
+    Returns:
+        list: Comment dictionaries with a 'sentiment' entry
+              (top-level copies; the sentiment dictionaries are shared)
+    """
+    return [dict(comment) for comment in _get_processed_comments(video_id)]